@@ -9,16 +9,16 @@ Author: aiyflowers
 """
 
 import sys
+import ctypes
 import subprocess
 import re
-import webbrowser
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTableWidget, QTableWidgetItem, QPushButton, QLabel, QStatusBar,
     QMessageBox, QHeaderView, QFrame, QGraphicsDropShadowEffect,
     QAbstractItemView
 )
-from PyQt5.QtCore import Qt, QTimer, QProcess
+from PyQt5.QtCore import Qt, QTimer, QProcess, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QIcon, QLinearGradient, QPalette, QBrush
 
 
@@ -43,42 +43,242 @@ COLORS = {
     "brand_gradient_end":   "#e94560",
 }
 
+# State column brushes, matched in order against the lowercased state text
+_SECONDARY_BRUSH = QBrush(QColor(COLORS["text_secondary"]))
+_STATE_BRUSH_RULES = [
+    ("attached",   QBrush(QColor(COLORS["success"]))),
+    ("shared",     QBrush(QColor(COLORS["accent"]))),
+    ("not shared", _SECONDARY_BRUSH),
+    ("not bound",  _SECONDARY_BRUSH),
+]
+_DEFAULT_STATE_BRUSH = QBrush(QColor(COLORS["warning"]))
+
+
+# ──────────────────────────────────────────────────────────
+#  Stylesheet (QSS)
+# ──────────────────────────────────────────────────────────
+_STYLESHEET = f"""
+    /* ── Global ──────────────────── */
+    QMainWindow {{
+        background-color: {COLORS['bg_dark']};
+    }}
+    QWidget {{
+        color: {COLORS['text_primary']};
+        font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
+        font-size: 13px;
+    }}
+
+    /* ── Header ─────────────────── */
+    #titleLabel {{
+        font-size: 26px;
+        font-weight: 700;
+        color: {COLORS['accent']};
+        padding: 0;
+    }}
+    #brandBadge {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['brand_gradient_start']},
+            stop:1 {COLORS['brand_gradient_end']});
+        color: #ffffff;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 6px 16px;
+        border-radius: 14px;
+    }}
+    #subtitleLabel {{
+        color: {COLORS['text_secondary']};
+        font-size: 13px;
+        padding-left: 2px;
+    }}
+
+    /* ── Separator ──────────────── */
+    #separator {{
+        border: none;
+        background-color: {COLORS['border']};
+        max-height: 1px;
+    }}
+
+    /* ── Table ──────────────────── */
+    #deviceTable {{
+        background-color: {COLORS['bg_card']};
+        alternate-background-color: {COLORS['bg_card_alt']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        gridline-color: transparent;
+        selection-background-color: rgba(88, 166, 255, 0.15);
+        selection-color: {COLORS['text_primary']};
+        padding: 4px;
+    }}
+    #deviceTable::item {{
+        padding: 8px 12px;
+        border-bottom: 1px solid {COLORS['border']};
+    }}
+    #deviceTable::item:selected {{
+        background-color: rgba(88, 166, 255, 0.18);
+    }}
+    QHeaderView::section {{
+        background-color: {COLORS['bg_dark']};
+        color: {COLORS['text_secondary']};
+        font-weight: 600;
+        font-size: 12px;
+        text-transform: uppercase;
+        padding: 10px 12px;
+        border: none;
+        border-bottom: 2px solid {COLORS['border']};
+    }}
+
+    /* ── Buttons ────────────────── */
+    QPushButton {{
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-weight: 600;
+        font-size: 13px;
+        background-color: {COLORS['bg_card']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton:hover {{
+        border-color: {COLORS['accent']};
+        background-color: {COLORS['bg_card_alt']};
+    }}
+    QPushButton:pressed {{
+        background-color: {COLORS['bg_dark']};
+    }}
+    QPushButton:disabled {{
+        color: {COLORS['text_secondary']};
+        border-color: {COLORS['bg_card']};
+        background-color: {COLORS['bg_dark']};
+    }}
+
+    /* Refresh button */
+    #refreshBtn {{
+        border-color: {COLORS['accent']};
+        color: {COLORS['accent']};
+    }}
+    #refreshBtn:hover {{
+        background-color: rgba(88, 166, 255, 0.12);
+    }}
+
+    /* Bind button */
+    #bindBtn {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['brand_gradient_start']},
+            stop:1 {COLORS['accent']});
+        color: #ffffff;
+        border: none;
+    }}
+    #bindBtn:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #7c6cf7,
+            stop:1 {COLORS['accent_hover']});
+    }}
+    #bindBtn:disabled {{
+        background: {COLORS['bg_card']};
+        color: {COLORS['text_secondary']};
+        border: 1px solid {COLORS['border']};
+    }}
+
+    /* Detach button */
+    #detachBtn {{
+        border-color: {COLORS['danger']};
+        color: {COLORS['danger']};
+    }}
+    #detachBtn:hover {{
+        background-color: rgba(248, 81, 73, 0.12);
+        border-color: {COLORS['danger_hover']};
+        color: {COLORS['danger_hover']};
+    }}
+    #detachBtn:disabled {{
+        color: {COLORS['text_secondary']};
+        border-color: {COLORS['bg_card']};
+        background-color: {COLORS['bg_dark']};
+    }}
+
+    /* Install button */
+    #installBtn {{
+        border-color: {COLORS['success']};
+        color: {COLORS['success']};
+    }}
+    #installBtn:hover {{
+        background-color: rgba(63, 185, 80, 0.12);
+    }}
+
+    /* ── Status bar ─────────────── */
+    QStatusBar {{
+        background-color: {COLORS['bg_dark']};
+        color: {COLORS['text_secondary']};
+        font-size: 12px;
+        border-top: 1px solid {COLORS['border']};
+        padding: 4px 8px;
+    }}
+"""
+
+
+# ──────────────────────────────────────────────────────────
+#  `usbipd list` parsing patterns
+# ──────────────────────────────────────────────────────────
+# Typical format: BUSID  VID:PID  DEVICE               STATE
+# e.g.: 1-1    046d:c52b  Logitech USB Input Device    Shared
+# Matches every device line of the whole output in one scan; separators,
+# blank lines and the "Persisted" GUID section simply don't match.
+_DEVICES_RE = re.compile(
+    r'^[ \t]*(?P<busid>\d+-\d+(?:\.\d+)*)[ \t]+'      # BUSID like 1-1 or 1-1.2
+    r'(?P<vidpid>[0-9a-fA-F]{4}:[0-9a-fA-F]{4})[ \t]+'  # VID:PID
+    r'(?P<name>.+?)[ \t]{2,}'                          # Device name (until 2+ spaces)
+    r'(?P<state>\S.*?)[ \t\r]*$',                       # State
+    re.MULTILINE
+)
+
 
 # ──────────────────────────────────────────────────────────
 #  Backend: usbipd command wrapper
 # ──────────────────────────────────────────────────────────
+def _is_admin():
+    """Return True if this process is already elevated (Windows only)."""
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (AttributeError, OSError):
+        return False
+
+
+_IS_ADMIN = _is_admin()
+
+
 class UsbIpdManager:
     """Wraps usbipd CLI commands."""
 
+    @staticmethod
+    def _decode(data):
+        return data.decode("utf-8", errors="replace")
+
     @staticmethod
     def _run(args, need_admin=False):
-        """Run a usbipd command and return (success, stdout, stderr)."""
-        cmd = ["usbipd"] + args
+        """
+        Run a usbipd command and return (success, stdout, stderr).
+        Output is returned as raw bytes; callers decode only what they use.
+        """
+        if need_admin and not _IS_ADMIN:
+            # Use PowerShell Start-Process with -Verb RunAs for elevation;
+            # pass the arguments as a single-quoted array literal
+            arg_list = ",".join("'" + a.replace("'", "''") + "'" for a in args)
+            ps_cmd = (
+                f'Start-Process -FilePath "usbipd" '
+                f'-ArgumentList @({arg_list}) '
+                f'-Verb RunAs -Wait -WindowStyle Hidden'
+            )
+            cmd, timeout = ["powershell", "-Command", ps_cmd], 30
+        else:
+            cmd, timeout = ["usbipd"] + args, 15
+
         try:
-            if need_admin:
-                # Use PowerShell Start-Process with -Verb RunAs for elevation
-                ps_cmd = (
-                    f'Start-Process -FilePath "usbipd" '
-                    f'-ArgumentList "{" ".join(args)}" '
-                    f'-Verb RunAs -Wait -WindowStyle Hidden'
-                )
-                result = subprocess.run(
-                    ["powershell", "-Command", ps_cmd],
-                    capture_output=True, text=True, timeout=30,
-                    encoding="utf-8", errors="replace"
-                )
-            else:
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=15,
-                    encoding="utf-8", errors="replace"
-                )
-            return (result.returncode == 0, result.stdout, result.stderr)
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout)
         except FileNotFoundError:
-            return (False, "", "usbipd 未安装或不在 PATH 中。\n请先安装 usbipd-win: https://github.com/dorssel/usbipd-win")
+            return (False, b"", "usbipd 未安装或不在 PATH 中。\n请先安装 usbipd-win: https://github.com/dorssel/usbipd-win".encode("utf-8"))
         except subprocess.TimeoutExpired:
-            return (False, "", "命令执行超时")
-        except Exception as e:
-            return (False, "", str(e))
+            return (False, b"", "命令执行超时".encode("utf-8"))
+        except OSError as e:
+            return (False, b"", str(e).encode("utf-8"))
+        return (result.returncode == 0, result.stdout, result.stderr)
 
     @classmethod
     def list_devices(cls):
@@ -88,84 +288,80 @@ class UsbIpdManager:
         """
         ok, stdout, stderr = cls._run(["list"])
         if not ok:
-            return (False, stderr or "无法获取设备列表")
-
-        devices = []
-        lines = stdout.strip().splitlines()
-
-        # Find the header line to determine column positions
-        header_idx = -1
-        for i, line in enumerate(lines):
-            if "BUSID" in line.upper():
-                header_idx = i
-                break
-
-        if header_idx == -1:
-            return (True, devices)
-
-        # Parse data lines after header (skip separator lines)
-        for line in lines[header_idx + 1:]:
-            line_stripped = line.strip()
-            if not line_stripped or line_stripped.startswith("-") or line_stripped.startswith("="):
-                continue
-            # Typical format: BUSID  VID:PID  DEVICE               STATE
-            # e.g.: 1-1    046d:c52b  Logitech USB Input Device    Shared
-            match = re.match(
-                r'^(\d+-\d+(?:\.\d+)*)\s+'   # BUSID like 1-1 or 1-1.2
-                r'([0-9a-fA-F]{4}:[0-9a-fA-F]{4})\s+'  # VID:PID
-                r'(.+?)\s{2,}'                 # Device name (greedy until 2+ spaces)
-                r'(\S+.*)$',                   # State
-                line_stripped
-            )
-            if match:
-                devices.append({
-                    "busid":  match.group(1),
-                    "vidpid": match.group(2),
-                    "name":   match.group(3).strip(),
-                    "state":  match.group(4).strip(),
-                })
-            else:
-                # Fallback: try splitting by 2+ whitespace
-                parts = re.split(r'\s{2,}', line_stripped)
-                if len(parts) >= 4:
-                    devices.append({
-                        "busid":  parts[0],
-                        "vidpid": parts[1],
-                        "name":   parts[2],
-                        "state":  parts[3],
-                    })
+            return (False, cls._decode(stderr) or "无法获取设备列表")
+
+        # Empty output (e.g. while the usbipd service restarts): nothing to parse
+        if not stdout.strip():
+            return (True, [])
+
+        stdout = cls._decode(stdout)
+
+        # Find the header line (usbipd always prints it uppercase);
+        # device lines follow it
+        header = stdout.find("BUSID")
+        if header == -1:
+            return (True, [])
 
+        devices = [m.groupdict() for m in _DEVICES_RE.finditer(stdout, header)]
         return (True, devices)
 
     @classmethod
     def bind(cls, busid):
         ok, stdout, stderr = cls._run(["bind", "--busid", busid], need_admin=True)
-        return (ok, stdout + stderr)
+        return (ok, cls._decode(stdout + stderr))
 
     @classmethod
     def attach(cls, busid):
         ok, stdout, stderr = cls._run(["attach", "--wsl", "--busid", busid])
-        return (ok, stdout + stderr)
+        return (ok, cls._decode(stdout + stderr))
 
     @classmethod
     def detach(cls, busid):
         ok, stdout, stderr = cls._run(["detach", "--busid", busid])
-        return (ok, stdout + stderr)
+        return (ok, cls._decode(stdout + stderr))
+
+
+# ──────────────────────────────────────────────────────────
+#  Background worker
+# ──────────────────────────────────────────────────────────
+class CommandWorker(QThread):
+    """Runs a blocking backend call off the GUI thread."""
+
+    result_ready = pyqtSignal(object)
+
+    def __init__(self, fn, parent=None):
+        super().__init__(parent)
+        self._fn = fn
+
+    def run(self):
+        self.result_ready.emit(self._fn())
 
 
 # ──────────────────────────────────────────────────────────
 #  Main Window
 # ──────────────────────────────────────────────────────────
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, refresh_ms=2000):
         super().__init__()
         self.setWindowTitle("USB IPD GUI — aiyflowers")
         self.setMinimumSize(900, 560)
         self.resize(1000, 620)
+        self.refresh_ms = refresh_ms
+        self._busy_tasks = 0
+        self._polling = False
+        self._last_devices_key = None
+        self._list_failed = False
+        self._usbipd_verified = False
         self._build_ui()
         self._apply_styles()
         self.refresh_devices()
 
+        # Auto refresh ───────────────────────────────────
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.timeout.connect(self._poll_devices)
+        if self.refresh_ms > 0:
+            self._refresh_timer.start(self.refresh_ms)
+
     # ── UI Construction ──────────────────────────────────
     def _build_ui(self):
         central = QWidget()
@@ -262,216 +458,123 @@ class MainWindow(QMainWindow):
 
     # ── Styles (QSS) ────────────────────────────────────
     def _apply_styles(self):
-        self.setStyleSheet(f"""
-            /* ── Global ──────────────────── */
-            QMainWindow {{
-                background-color: {COLORS['bg_dark']};
-            }}
-            QWidget {{
-                color: {COLORS['text_primary']};
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-            }}
-
-            /* ── Header ─────────────────── */
-            #titleLabel {{
-                font-size: 26px;
-                font-weight: 700;
-                color: {COLORS['accent']};
-                padding: 0;
-            }}
-            #brandBadge {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['brand_gradient_start']},
-                    stop:1 {COLORS['brand_gradient_end']});
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 6px 16px;
-                border-radius: 14px;
-            }}
-            #subtitleLabel {{
-                color: {COLORS['text_secondary']};
-                font-size: 13px;
-                padding-left: 2px;
-            }}
-
-            /* ── Separator ──────────────── */
-            #separator {{
-                border: none;
-                background-color: {COLORS['border']};
-                max-height: 1px;
-            }}
-
-            /* ── Table ──────────────────── */
-            #deviceTable {{
-                background-color: {COLORS['bg_card']};
-                alternate-background-color: {COLORS['bg_card_alt']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                gridline-color: transparent;
-                selection-background-color: rgba(88, 166, 255, 0.15);
-                selection-color: {COLORS['text_primary']};
-                padding: 4px;
-            }}
-            #deviceTable::item {{
-                padding: 8px 12px;
-                border-bottom: 1px solid {COLORS['border']};
-            }}
-            #deviceTable::item:selected {{
-                background-color: rgba(88, 166, 255, 0.18);
-            }}
-            QHeaderView::section {{
-                background-color: {COLORS['bg_dark']};
-                color: {COLORS['text_secondary']};
-                font-weight: 600;
-                font-size: 12px;
-                text-transform: uppercase;
-                padding: 10px 12px;
-                border: none;
-                border-bottom: 2px solid {COLORS['border']};
-            }}
-
-            /* ── Buttons ────────────────── */
-            QPushButton {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-weight: 600;
-                font-size: 13px;
-                background-color: {COLORS['bg_card']};
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton:hover {{
-                border-color: {COLORS['accent']};
-                background-color: {COLORS['bg_card_alt']};
-            }}
-            QPushButton:pressed {{
-                background-color: {COLORS['bg_dark']};
-            }}
-            QPushButton:disabled {{
-                color: {COLORS['text_secondary']};
-                border-color: {COLORS['bg_card']};
-                background-color: {COLORS['bg_dark']};
-            }}
-
-            /* Refresh button */
-            #refreshBtn {{
-                border-color: {COLORS['accent']};
-                color: {COLORS['accent']};
-            }}
-            #refreshBtn:hover {{
-                background-color: rgba(88, 166, 255, 0.12);
-            }}
-
-            /* Bind button */
-            #bindBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['brand_gradient_start']},
-                    stop:1 {COLORS['accent']});
-                color: #ffffff;
-                border: none;
-            }}
-            #bindBtn:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7c6cf7,
-                    stop:1 {COLORS['accent_hover']});
-            }}
-            #bindBtn:disabled {{
-                background: {COLORS['bg_card']};
-                color: {COLORS['text_secondary']};
-                border: 1px solid {COLORS['border']};
-            }}
-
-            /* Detach button */
-            #detachBtn {{
-                border-color: {COLORS['danger']};
-                color: {COLORS['danger']};
-            }}
-            #detachBtn:hover {{
-                background-color: rgba(248, 81, 73, 0.12);
-                border-color: {COLORS['danger_hover']};
-                color: {COLORS['danger_hover']};
-            }}
-            #detachBtn:disabled {{
-                color: {COLORS['text_secondary']};
-                border-color: {COLORS['bg_card']};
-                background-color: {COLORS['bg_dark']};
-            }}
-
-            /* Install button */
-            #installBtn {{
-                border-color: {COLORS['success']};
-                color: {COLORS['success']};
-            }}
-            #installBtn:hover {{
-                background-color: rgba(63, 185, 80, 0.12);
-            }}
-
-            /* ── Status bar ─────────────── */
-            QStatusBar {{
-                background-color: {COLORS['bg_dark']};
-                color: {COLORS['text_secondary']};
-                font-size: 12px;
-                border-top: 1px solid {COLORS['border']};
-                padding: 4px 8px;
-            }}
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
     # ── Device List ──────────────────────────────────────
     def refresh_devices(self):
         self.status.showMessage("⏳ 正在扫描 USB 设备…")
-        QApplication.processEvents()
+        self._run_task(UsbIpdManager.list_devices, self._on_devices_listed)
 
-        ok, result = UsbIpdManager.list_devices()
-        self.table.setRowCount(0)
+    def _poll_devices(self):
+        """Timer-driven refresh; stays quiet unless the device list changes."""
+        if self._busy_tasks or self._polling:
+            return
+        self._polling = True
+        self._run_task(UsbIpdManager.list_devices, self._on_devices_polled, block_ui=False)
+
+    def _on_devices_polled(self, listing):
+        self._polling = False
+        self._on_devices_listed(listing, quiet=True)
+
+    def _on_devices_listed(self, listing, quiet=False):
+        ok, result = listing
 
         if not ok:
+            # A failed background poll is often transient (e.g. the usbipd
+            # service restarting), so keep the rows for the next poll to reuse
+            if not quiet:
+                self.table.setRowCount(0)
+                self._last_devices_key = None
+            self._list_failed = True
             self.status.showMessage(f"❌ {result}")
             return
 
+        # A successful `usbipd list` already proves usbipd is installed
+        self._usbipd_verified = True
         devices = result
-        self.table.setRowCount(len(devices))
-
-        for row, dev in enumerate(devices):
-            self.table.setItem(row, 0, QTableWidgetItem(dev["busid"]))
-            self.table.setItem(row, 1, QTableWidgetItem(dev["vidpid"]))
-            self.table.setItem(row, 2, QTableWidgetItem(dev["name"]))
-
-            state_item = QTableWidgetItem(dev["state"])
-            state = dev["state"].lower()
-            if "attached" in state:
-                state_item.setForeground(QColor(COLORS["success"]))
-            elif "shared" in state:
-                state_item.setForeground(QColor(COLORS["accent"]))
-            elif "not shared" in state or "not bound" in state:
-                state_item.setForeground(QColor(COLORS["text_secondary"]))
-            else:
-                state_item.setForeground(QColor(COLORS["warning"]))
-            self.table.setItem(row, 3, state_item)
-
         count = len(devices)
+        key = tuple((d["busid"], d["vidpid"], d["name"], d["state"]) for d in devices)
+        recovered, self._list_failed = self._list_failed, False
+        if key == self._last_devices_key:
+            if not quiet or recovered:
+                self.status.showMessage(f"✅ 扫描完成 — 发现 {count} 个 USB 设备")
+            return
+
+        # Batch the mutations so Qt repaints once for the whole update
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            # Only touch cells whose text actually changed
+            if self.table.rowCount() != count:
+                self.table.setRowCount(count)
+
+            for row, (dev, values) in enumerate(zip(devices, key)):
+                for col, text in enumerate(values):
+                    item = self.table.item(row, col)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        self.table.setItem(row, col, item)
+                    elif item.text() != text:
+                        item.setText(text)
+                    else:
+                        continue
+                    if col == 3:
+                        self._apply_state_color(item)
+                # Keep the parsed device on the row for _get_selected_device
+                self.table.item(row, 0).setData(Qt.UserRole, dev)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.setSortingEnabled(sorting)
+        self.table.viewport().update()
+
+        self._last_devices_key = key
         self.status.showMessage(f"✅ 扫描完成 — 发现 {count} 个 USB 设备")
         self._update_button_states()
 
+    def _apply_state_color(self, state_item):
+        state = state_item.text().lower()
+        brush = next((b for k, b in _STATE_BRUSH_RULES if k in state), _DEFAULT_STATE_BRUSH)
+        state_item.setForeground(brush)
+
+    # ── Background Tasks ─────────────────────────────────
+    def _run_task(self, fn, on_done, block_ui=True):
+        """Run `fn` in a worker thread and deliver its result to `on_done`."""
+        worker = CommandWorker(fn, self)
+        worker.result_ready.connect(on_done)
+        worker.finished.connect(worker.deleteLater)
+        if block_ui:
+            worker.finished.connect(self._on_task_finished)
+            self._busy_tasks += 1
+            self._update_button_states()
+        worker.start()
+
+    def _on_task_finished(self):
+        self._busy_tasks -= 1
+        self._update_button_states()
+
+    def closeEvent(self, event):
+        for worker in self.findChildren(CommandWorker):
+            worker.wait()
+        super().closeEvent(event)
+
     # ── Actions ──────────────────────────────────────────
     def _get_selected_device(self):
         rows = self.table.selectionModel().selectedRows()
         if not rows:
             return None
-        row = rows[0].row()
-        return {
-            "busid":  self.table.item(row, 0).text(),
-            "vidpid": self.table.item(row, 1).text(),
-            "name":   self.table.item(row, 2).text(),
-            "state":  self.table.item(row, 3).text(),
-        }
+        return self.table.item(rows[0].row(), 0).data(Qt.UserRole)
 
     def _update_button_states(self):
         dev = self._get_selected_device()
+        idle = self._busy_tasks == 0
         has_sel = dev is not None
-        self.btn_bind.setEnabled(has_sel)
-        self.btn_detach.setEnabled(has_sel)
+        self.btn_refresh.setEnabled(idle)
+        self.btn_install.setEnabled(idle)
+        self.btn_bind.setEnabled(idle and has_sel)
+        self.btn_detach.setEnabled(idle and has_sel)
 
     def on_bind(self):
         dev = self._get_selected_device()
@@ -489,11 +592,15 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
 
+        # Step 1: Bind
         self.status.showMessage(f"⏳ 正在绑定 {dev['busid']}…（需要管理员权限）")
-        QApplication.processEvents()
+        self._run_task(
+            lambda: (dev, *UsbIpdManager.bind(dev["busid"])),
+            self._on_bind_done
+        )
 
-        # Step 1: Bind
-        ok, msg = UsbIpdManager.bind(dev["busid"])
+    def _on_bind_done(self, outcome):
+        dev, ok, msg = outcome
         if not ok and "already bound" not in msg.lower():
             self.status.showMessage(f"❌ 绑定失败: {msg.strip()}")
             QMessageBox.warning(self, "绑定失败", f"绑定设备失败:\n{msg.strip()}")
@@ -501,9 +608,13 @@ class MainWindow(QMainWindow):
 
         # Step 2: Attach to WSL
         self.status.showMessage(f"⏳ 正在连接 {dev['busid']} 到 WSL…")
-        QApplication.processEvents()
+        self._run_task(
+            lambda: (dev, *UsbIpdManager.attach(dev["busid"])),
+            self._on_attach_done
+        )
 
-        ok, msg = UsbIpdManager.attach(dev["busid"])
+    def _on_attach_done(self, outcome):
+        dev, ok, msg = outcome
         if ok:
             self.status.showMessage(f"✅ 设备 {dev['busid']} 已成功绑定并连接到 WSL")
         else:
@@ -529,9 +640,13 @@ class MainWindow(QMainWindow):
             return
 
         self.status.showMessage(f"⏳ 正在解绑 {dev['busid']}…")
-        QApplication.processEvents()
+        self._run_task(
+            lambda: (dev, *UsbIpdManager.detach(dev["busid"])),
+            self._on_detach_done
+        )
 
-        ok, msg = UsbIpdManager.detach(dev["busid"])
+    def _on_detach_done(self, outcome):
+        dev, ok, msg = outcome
         if ok:
             self.status.showMessage(f"✅ 设备 {dev['busid']} 已从 WSL 解绑")
         else:
@@ -542,15 +657,18 @@ class MainWindow(QMainWindow):
 
     def _verify_usbipd_installed(self):
         """Check if usbipd is usable by running `usbipd list`."""
+        if self._usbipd_verified:
+            return True
         try:
             result = subprocess.run(
                 ["usbipd", "list"],
                 capture_output=True, text=True, timeout=10,
                 encoding="utf-8", errors="replace"
             )
-            return result.returncode == 0
         except Exception:
             return False
+        self._usbipd_verified = (result.returncode == 0)
+        return self._usbipd_verified
 
     def _prompt_manual_install(self):
         """Show manual install dialog and open GitHub page on close."""
@@ -561,12 +679,33 @@ class MainWindow(QMainWindow):
             "请按照页面说明手动下载安装。<br><br>"
             "<i>安装完成后请重新打开本程序。</i>"
         )
+        import webbrowser  # only needed on this rarely used path
         webbrowser.open("https://github.com/dorssel/usbipd-win?tab=readme-ov-file")
 
+    def _run_winget_install(self):
+        """Run `winget install usbipd` and return (success, output)."""
+        try:
+            result = subprocess.run(
+                ["winget", "install", "usbipd"],
+                capture_output=True, text=True, timeout=120,
+                encoding="utf-8", errors="replace"
+            )
+            return (result.returncode == 0, (result.stdout + result.stderr).strip())
+        except FileNotFoundError:
+            return (False, "未找到 winget 命令")
+        except subprocess.TimeoutExpired:
+            return (False, "安装命令执行超时 (120秒)")
+        except Exception as e:
+            return (False, str(e))
+
     def on_install_env(self):
         """Install usbipd-win via winget, verify, and fallback to browser."""
         # Step 0: Check if already installed
-        if self._verify_usbipd_installed():
+        self.status.showMessage("⏳ 正在检测 usbipd-win …")
+        self._run_task(self._verify_usbipd_installed, self._on_install_checked)
+
+    def _on_install_checked(self, installed):
+        if installed:
             QMessageBox.information(
                 self, "已安装",
                 "usbipd-win 已经安装，无需重复安装。"
@@ -585,34 +724,21 @@ class MainWindow(QMainWindow):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
         )
         if reply != QMessageBox.Yes:
+            self.status.showMessage("就绪")
             return
 
         # Step 1: Try winget install
         self.status.showMessage("⏳ 正在通过 winget 安装 usbipd-win …")
-        QApplication.processEvents()
-
-        winget_ok = False
-        winget_output = ""
-        try:
-            result = subprocess.run(
-                ["winget", "install", "usbipd"],
-                capture_output=True, text=True, timeout=120,
-                encoding="utf-8", errors="replace"
-            )
-            winget_output = (result.stdout + result.stderr).strip()
-            winget_ok = (result.returncode == 0)
-        except FileNotFoundError:
-            winget_output = "未找到 winget 命令"
-        except subprocess.TimeoutExpired:
-            winget_output = "安装命令执行超时 (120秒)"
-        except Exception as e:
-            winget_output = str(e)
+        self._run_task(self._run_winget_install, self._on_winget_done)
 
+    def _on_winget_done(self, outcome):
         # Step 2: Verify installation regardless of winget exit code
+        self._usbipd_verified = False
         self.status.showMessage("⏳ 正在验证 usbipd 安装…")
-        QApplication.processEvents()
+        self._run_task(self._verify_usbipd_installed, self._on_install_verified)
 
-        if self._verify_usbipd_installed():
+    def _on_install_verified(self, installed):
+        if installed:
             self.status.showMessage("✅ usbipd-win 安装并验证成功")
             QMessageBox.information(
                 self, "安装成功",